@@ -15,6 +15,14 @@ class EmbeddingProvider(ABC):
         """Embed a query into a vector."""
         pass
 
+    async def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """
+        Embed a list of queries into vectors, staying in query space.
+        Providers that can batch should override this; the default just
+        embeds them one by one.
+        """
+        return [await self.embed_query(query) for query in queries]
+
     @abstractmethod
     def get_vector_name(self) -> str:
         """Get the name of the vector for the Qdrant collection."""
@@ -0,0 +1,127 @@
+import hashlib
+import sqlite3
+from collections import OrderedDict
+from typing import List, Optional
+
+import numpy as np
+
+from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+
+DEFAULT_MEMORY_CACHE_SIZE = 10_000
+
+
+class CachedEmbeddingProvider(EmbeddingProvider):
+    """
+    Wraps another embedding provider and memoizes its vectors.
+    Cache keys are `sha256(model_name + "\\0" + role + "\\0" + text)`, where
+    role is "doc" or "query", so the same text embedded with a different
+    model — or as a passage instead of a query — never collides. Hits are
+    served from an
+    in-memory LRU first, then from an optional sqlite file that survives
+    restarts; only misses reach the inner provider.
+    :param inner: The embedding provider doing the actual work.
+    :param cache_path: Path to the sqlite cache file. If None, only the
+                       in-memory cache is used.
+    :param memory_cache_size: Maximum number of vectors kept in memory.
+    """
+
+    def __init__(
+        self,
+        inner: EmbeddingProvider,
+        cache_path: Optional[str] = None,
+        memory_cache_size: int = DEFAULT_MEMORY_CACHE_SIZE,
+    ):
+        self._inner = inner
+        self._memory_cache_size = memory_cache_size
+        self._memory_cache: OrderedDict[bytes, List[float]] = OrderedDict()
+        self._db: Optional[sqlite3.Connection] = None
+        if cache_path:
+            self._db = sqlite3.connect(cache_path)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings "
+                "(key BLOB PRIMARY KEY, vec BLOB)"
+            )
+            self._db.commit()
+
+    def _cache_key(self, text: str, role: str) -> bytes:
+        # role keeps passage and query embeddings of the same text apart;
+        # providers like FastEmbed produce different vectors for each
+        model_name = getattr(self._inner, "model_name", "")
+        return hashlib.sha256(
+            f"{model_name}\0{role}\0{text}".encode("utf-8")
+        ).digest()
+
+    def _get(self, key: bytes) -> Optional[List[float]]:
+        if key in self._memory_cache:
+            self._memory_cache.move_to_end(key)
+            return self._memory_cache[key]
+        if self._db is not None:
+            row = self._db.execute(
+                "SELECT vec FROM embeddings WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None:
+                vec = np.frombuffer(row[0], dtype=np.float32).tolist()
+                self._put_memory(key, vec)
+                return vec
+        return None
+
+    def _put(self, key: bytes, vec: List[float]):
+        self._put_memory(key, vec)
+        if self._db is not None:
+            blob = np.asarray(vec, dtype=np.float32).tobytes()
+            self._db.execute(
+                "INSERT OR REPLACE INTO embeddings (key, vec) VALUES (?, ?)",
+                (key, blob),
+            )
+            self._db.commit()
+
+    def _put_memory(self, key: bytes, vec: List[float]):
+        self._memory_cache[key] = vec
+        self._memory_cache.move_to_end(key)
+        while len(self._memory_cache) > self._memory_cache_size:
+            self._memory_cache.popitem(last=False)
+
+    async def embed_documents(self, documents: List[str]) -> List[List[float]]:
+        """Embed a list of documents, only re-embedding cache misses."""
+        keys = [self._cache_key(doc, "doc") for doc in documents]
+        results: List[Optional[List[float]]] = [self._get(k) for k in keys]
+
+        miss_indices = [i for i, vec in enumerate(results) if vec is None]
+        if miss_indices:
+            misses = [documents[i] for i in miss_indices]
+            embedded = await self._inner.embed_documents(misses)
+            for i, vec in zip(miss_indices, embedded):
+                self._put(keys[i], vec)
+                results[i] = vec
+
+        return results  # type: ignore[return-value]
+
+    async def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed a list of queries, only re-embedding cache misses."""
+        keys = [self._cache_key(query, "query") for query in queries]
+        results: List[Optional[List[float]]] = [self._get(k) for k in keys]
+
+        miss_indices = [i for i, vec in enumerate(results) if vec is None]
+        if miss_indices:
+            misses = [queries[i] for i in miss_indices]
+            embedded = await self._inner.embed_queries(misses)
+            for i, vec in zip(miss_indices, embedded):
+                self._put(keys[i], vec)
+                results[i] = vec
+
+        return results  # type: ignore[return-value]
+
+    async def embed_query(self, query: str) -> List[float]:
+        """Embed a query, serving repeats from the cache."""
+        key = self._cache_key(query, "query")
+        vec = self._get(key)
+        if vec is None:
+            vec = await self._inner.embed_query(query)
+            self._put(key, vec)
+        return vec
+
+    def get_vector_name(self) -> str:
+        return self._inner.get_vector_name()
+
+    def get_vector_size(self) -> int:
+        return self._inner.get_vector_size()
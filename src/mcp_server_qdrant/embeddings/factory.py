@@ -1,4 +1,5 @@
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
+from mcp_server_qdrant.embeddings.cache import CachedEmbeddingProvider
 from mcp_server_qdrant.embeddings.types import EmbeddingProviderType
 from mcp_server_qdrant.settings import EmbeddingProviderSettings
 from mcp_server_qdrant.embeddings.fastembed import FastEmbedProvider
@@ -13,10 +14,14 @@ def create_embedding_provider(settings: EmbeddingProviderSettings) -> EmbeddingP
     :return: An instance of the specified embedding provider.
     """
     if settings.provider_type == EmbeddingProviderType.FASTEMBED:
-        return FastEmbedProvider(settings.model_name)
-    if settings.provider_type is EmbeddingProviderType.OLLAMA:
-        return OllamaEmbedProvider(
+        provider = FastEmbedProvider(settings.model_name)
+    elif settings.provider_type is EmbeddingProviderType.OLLAMA:
+        provider = OllamaEmbedProvider(
             model_name=settings.model_name,
             base_url=os.getenv("OLLAMA_BASE_URL"),
         )
-    raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
+    else:
+        raise ValueError(f"Unsupported embedding provider: {settings.provider_type}")
+    if settings.cache_embeddings:
+        provider = CachedEmbeddingProvider(provider, cache_path=settings.cache_path)
+    return provider
@@ -35,6 +35,15 @@ class FastEmbedProvider(EmbeddingProvider):
         )
         return embeddings[0].tolist()
 
+    async def embed_queries(self, queries: List[str]) -> List[List[float]]:
+        """Embed a list of queries into vectors, using the query prompt."""
+        # Run in a thread pool since FastEmbed is synchronous
+        loop = asyncio.get_event_loop()
+        embeddings = await loop.run_in_executor(
+            None, lambda: list(self.embedding_model.query_embed(queries))
+        )
+        return [embedding.tolist() for embedding in embeddings]
+
     def get_vector_name(self) -> str:
         """
         Return the name of the vector for the Qdrant collection.
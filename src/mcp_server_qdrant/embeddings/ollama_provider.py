@@ -1,30 +1,65 @@
 # src/mcp_server_qdrant/embeddings/ollama_provider.py
+from asyncio import gather
 from typing import List
+
+import httpx
+import numpy as np
 from ollama import AsyncClient
 from mcp_server_qdrant.embeddings.base import EmbeddingProvider
 
 VECTOR_DIM = 1024        # bge-m3
 DEFAULT_BASE = "http://192.168.10.3:31784"
+DEFAULT_BATCH_SIZE = 64  # docs per /api/embed request
 
 class OllamaEmbedProvider(EmbeddingProvider):
     def __init__(self, model_name: str,
                  base_url: str | None = None,
-                 timeout: int = 120):
+                 timeout: int = 120,
+                 batch_size: int = DEFAULT_BATCH_SIZE):
         self.model_name = model_name
+        self.batch_size = batch_size
+        # One shared client for the life of the provider, with a pool large
+        # enough that concurrent embed calls reuse keep-alive connections
+        # instead of paying a new handshake each time.
         self.client = AsyncClient(
             host=(base_url or DEFAULT_BASE).rstrip("/"),
-            timeout=timeout,
+            timeout=httpx.Timeout(timeout, connect=5),
+            limits=httpx.Limits(
+                max_connections=128,
+                max_keepalive_connections=64,
+                keepalive_expiry=30,
+            ),
         )
 
-    async def _embed(self, text: str) -> List[float]:
-        r = await self.client.embed(model=self.model_name, input=text)
-        return r["embeddings"][0]
+    async def _embed_batch(self, texts: List[str]) -> List[np.ndarray]:
+        # /api/embed accepts a list in `input`, so one request covers the
+        # whole batch instead of one round trip per document.
+        # Vectors are packed into float32 arrays right at the boundary:
+        # gRPC serializes them as packed repeated floats and we avoid
+        # boxing 1024 Python floats per vector.
+        r = await self.client.embed(model=self.model_name, input=texts)
+        return [np.asarray(vec, dtype=np.float32) for vec in r["embeddings"]]
+
+    async def _embed(self, text: str) -> np.ndarray:
+        return (await self._embed_batch([text]))[0]
+
+    async def _embed_chunked(self, texts: List[str]) -> List[np.ndarray]:
+        chunks = [
+            texts[i:i + self.batch_size]
+            for i in range(0, len(texts), self.batch_size)
+        ]
+        results = await gather(*[self._embed_batch(c) for c in chunks])
+        return [vec for chunk in results for vec in chunk]
 
-    async def embed_documents(self, docs: List[str]) -> List[List[float]]:
-        from asyncio import gather
-        return await gather(*[self._embed(d) for d in docs])
+    async def embed_documents(self, docs: List[str]) -> List[np.ndarray]:
+        return await self._embed_chunked(docs)
 
-    async def embed_query(self, query: str) -> List[float]:
+    async def embed_queries(self, queries: List[str]) -> List[np.ndarray]:
+        # /api/embed draws no passage/query distinction, so the same
+        # batched path serves both roles
+        return await self._embed_chunked(queries)
+
+    async def embed_query(self, query: str) -> np.ndarray:
         return await self._embed(query)
 
     def get_vector_name(self) -> str:
@@ -32,4 +67,3 @@ class OllamaEmbedProvider(EmbeddingProvider):
 
     def get_vector_size(self) -> int:
         return VECTOR_DIM
-
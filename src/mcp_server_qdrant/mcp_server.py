@@ -1,6 +1,8 @@
+import asyncio
 import json
 import logging
-from typing import Any, List
+import operator
+from typing import Any, Callable, List, Optional, Tuple
 
 from mcp.server.fastmcp import Context, FastMCP
 
@@ -14,6 +16,88 @@ from mcp_server_qdrant.settings import (
 
 logger = logging.getLogger(__name__)
 
+# How long the find batcher waits for more queries before dispatching
+FIND_BATCH_WINDOW = 0.005  # seconds
+
+
+class FindBatcher:
+    """
+    Coalesces `find` calls arriving within a small time window into a single
+    `QdrantConnector.search_many` call, so concurrent queries share one
+    batched Qdrant round trip instead of serializing individual RPCs.
+    :param connector: The Qdrant connector to dispatch batches through.
+    :param limit: The maximum number of entries to return per query.
+    :param window: How long to wait for more queries, in seconds.
+    """
+
+    def __init__(
+        self,
+        connector: QdrantConnector,
+        limit: int,
+        window: float = FIND_BATCH_WINDOW,
+    ):
+        self._connector = connector
+        self._limit = limit
+        self._window = window
+        self._pending: list[tuple[str, str, asyncio.Future]] = []
+        self._flush_task: asyncio.Task | None = None
+
+    async def search(self, query: str, collection_name: str) -> list[Entry]:
+        """Queue a query and wait for its slice of the batched result."""
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future = loop.create_future()
+        self._pending.append((query, collection_name, future))
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_after_window())
+        return await future
+
+    async def _flush_after_window(self):
+        # Loop until the pending list is empty: queries arriving while a
+        # dispatch is in flight land in _pending without scheduling a new
+        # flush task (this one is not done yet), so they must be picked up
+        # here or their callers would await forever. The final emptiness
+        # check and the task finishing happen without an intervening await,
+        # so no query can slip in between them.
+        while True:
+            await asyncio.sleep(self._window)
+            pending, self._pending = self._pending, []
+
+            # Queries for the same collection go out in one batched call.
+            # Groups run concurrently, so callers on a fast collection get
+            # their results as soon as their own batch returns rather than
+            # waiting behind a slower one.
+            groups: dict[str, list[tuple[str, asyncio.Future]]] = {}
+            for query, collection_name, future in pending:
+                groups.setdefault(collection_name, []).append((query, future))
+
+            await asyncio.gather(
+                *(
+                    self._dispatch_group(collection_name, items)
+                    for collection_name, items in groups.items()
+                )
+            )
+
+            if not self._pending:
+                break
+
+    async def _dispatch_group(
+        self, collection_name: str, items: list[tuple[str, asyncio.Future]]
+    ):
+        try:
+            results = await self._connector.search_many(
+                [query for query, _ in items],
+                collection_name=collection_name,
+                limit=self._limit,
+            )
+        except Exception as e:
+            for _, future in items:
+                if not future.done():
+                    future.set_exception(e)
+        else:
+            for (_, future), entries in zip(items, results):
+                if not future.done():
+                    future.set_result(entries)
+
 
 # FastMCP is an alternative interface for declaring the capabilities
 # of the server. Its API is based on FastAPI.
@@ -42,15 +126,42 @@ class QdrantMCPServer(FastMCP):
             qdrant_settings.collection_name,
             self.embedding_provider,
             qdrant_settings.local_path,
+            prefer_grpc=qdrant_settings.prefer_grpc,
+            grpc_port=qdrant_settings.grpc_port,
+        )
+        self.find_batcher = FindBatcher(
+            self.qdrant_connector,
+            qdrant_settings.search_limit,
         )
+        # Cached payload shape for format_entry's fast path
+        self._fmt_keys: Optional[Tuple[str, ...]] = None
+        self._fmt_getter: Optional[Callable[[dict], Any]] = None
 
         super().__init__(name=name, instructions=instructions, **settings)
 
         self.setup_tools()
 
     def format_entry(self, entry: Entry) -> str:
-        parts = [f"{k}: {v}" for k, v in entry.payload.items()]
-        return " | ".join(parts)
+        # Payload shapes are stable in practice, so freeze the key tuple on
+        # first use and read values with one itemgetter call per entry
+        # instead of iterating the dict. Falls back to the generic path
+        # whenever the shape differs.
+        payload = entry.payload
+        if self._fmt_keys is not None and len(payload) == len(self._fmt_keys):
+            try:
+                values = self._fmt_getter(payload)
+                if len(self._fmt_keys) == 1:
+                    values = (values,)
+                return " | ".join(
+                    f"{k}: {v}" for k, v in zip(self._fmt_keys, values)
+                )
+            except KeyError:
+                pass
+        keys = tuple(payload.keys())
+        if keys:
+            self._fmt_keys = keys
+            self._fmt_getter = operator.itemgetter(*keys)
+        return " | ".join(f"{k}: {v}" for k, v in payload.items())
 
     def setup_tools(self):
         """
@@ -105,11 +216,7 @@ class QdrantMCPServer(FastMCP):
                     f"Overriding the collection name with {collection_name}"
                 )
 
-            entries = await self.qdrant_connector.search(
-                query,
-                collection_name=collection_name,
-                limit=self.qdrant_settings.search_limit,
-            )
+            entries = await self.find_batcher.search(query, collection_name)
             if not entries:
                 return [f"No information found for the query '{query}'"]
             content = [
@@ -179,10 +286,11 @@ class QdrantMCPServer(FastMCP):
             find_recent,
             name="qdrant-find-recent",
             description=(
-                "Look up memories in Qdrant that match `query` and were "
-                "published after `after_ts` (epoch-ms) or within the last "
-                "`days` days. Returns newest first with full payload "
-                "(title, source_url, published_date, tags…)."
+                "List memories in Qdrant published after `after_ts` "
+                "(epoch-ms) or within the last `days` days. Returns newest "
+                "first with full payload (title, source_url, "
+                "published_date, tags…). Results are ordered by date only; "
+                "`query` does not affect the ranking."
             ),
         )
 
@@ -52,6 +52,14 @@ class EmbeddingProviderSettings(BaseSettings):
         default="bge-m3",
         validation_alias="EMBEDDING_MODEL",
     )
+    cache_embeddings: bool = Field(
+        default=False,
+        validation_alias="EMBEDDING_CACHE",
+    )
+    cache_path: Optional[str] = Field(
+        default=None,
+        validation_alias="EMBEDDING_CACHE_PATH",
+    )
 
 
 class QdrantSettings(BaseSettings):
@@ -69,3 +77,5 @@ class QdrantSettings(BaseSettings):
     )
     search_limit: int = Field(default=10, validation_alias="QDRANT_SEARCH_LIMIT")
     read_only: bool = Field(default=False, validation_alias="QDRANT_READ_ONLY")
+    prefer_grpc: bool = Field(default=True, validation_alias="QDRANT_PREFER_GRPC")
+    grpc_port: int = Field(default=6334, validation_alias="QDRANT_GRPC_PORT")
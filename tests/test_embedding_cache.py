@@ -0,0 +1,97 @@
+# tests/test_embedding_cache.py
+
+import pytest
+
+from mcp_server_qdrant.embeddings.cache import CachedEmbeddingProvider
+
+
+class CountingEmbeddingProvider:
+    """Mock provider that counts how often it is actually called."""
+
+    model_name = "mock-model"
+
+    def __init__(self):
+        self.document_calls = 0
+        self.query_calls = 0
+
+    def get_vector_name(self):
+        return "default"
+
+    def get_vector_size(self):
+        return 4
+
+    async def embed_documents(self, texts):
+        self.document_calls += 1
+        return [[float(len(t))] * self.get_vector_size() for t in texts]
+
+    async def embed_query(self, query):
+        self.query_calls += 1
+        return [float(len(query))] * self.get_vector_size()
+
+    async def embed_queries(self, queries):
+        self.query_calls += 1
+        return [[float(len(q))] * self.get_vector_size() for q in queries]
+
+
+@pytest.mark.asyncio
+async def test_embed_query_is_cached():
+    inner = CountingEmbeddingProvider()
+    provider = CachedEmbeddingProvider(inner)
+
+    first = await provider.embed_query("hello")
+    second = await provider.embed_query("hello")
+
+    assert first == second
+    assert inner.query_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_embed_documents_only_embeds_misses():
+    inner = CountingEmbeddingProvider()
+    provider = CachedEmbeddingProvider(inner)
+
+    await provider.embed_documents(["a", "bb"])
+    results = await provider.embed_documents(["a", "ccc", "bb"])
+
+    assert results == [[1.0] * 4, [3.0] * 4, [2.0] * 4]
+    assert inner.document_calls == 2
+
+
+@pytest.mark.asyncio
+async def test_embed_queries_shares_slots_with_embed_query():
+    inner = CountingEmbeddingProvider()
+    provider = CachedEmbeddingProvider(inner)
+
+    await provider.embed_query("hello")
+    results = await provider.embed_queries(["hello", "world"])
+
+    assert results == [[5.0] * 4, [5.0] * 4]
+    assert inner.query_calls == 2  # single embed + one batch for the miss
+
+
+@pytest.mark.asyncio
+async def test_document_and_query_embeddings_do_not_share_slots():
+    inner = CountingEmbeddingProvider()
+    provider = CachedEmbeddingProvider(inner)
+
+    await provider.embed_documents(["same text"])
+    await provider.embed_query("same text")
+
+    assert inner.document_calls == 1
+    assert inner.query_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_sqlite_cache_survives_reopen(tmp_path):
+    cache_file = str(tmp_path / "embeddings.sqlite")
+
+    inner = CountingEmbeddingProvider()
+    provider = CachedEmbeddingProvider(inner, cache_path=cache_file)
+    await provider.embed_query("persisted")
+
+    reopened_inner = CountingEmbeddingProvider()
+    reopened = CachedEmbeddingProvider(reopened_inner, cache_path=cache_file)
+    vec = await reopened.embed_query("persisted")
+
+    assert vec == [9.0] * 4
+    assert reopened_inner.query_calls == 0
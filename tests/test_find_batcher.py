@@ -0,0 +1,92 @@
+# tests/test_find_batcher.py
+
+import asyncio
+
+import pytest
+
+from mcp_server_qdrant.mcp_server import FindBatcher
+from mcp_server_qdrant.qdrant import Entry
+
+
+class MockConnector:
+    """Mock connector that records each search_many batch it receives."""
+
+    def __init__(self):
+        self.batches = []
+
+    async def search_many(self, queries, *, collection_name, limit):
+        self.batches.append((tuple(queries), collection_name))
+        return [
+            [Entry(payload={"content": f"result for {q}"})]
+            for q in queries
+        ]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_batch():
+    connector = MockConnector()
+    batcher = FindBatcher(connector, limit=5)
+
+    results = await asyncio.gather(
+        batcher.search("first", "memories"),
+        batcher.search("second", "memories"),
+    )
+
+    assert len(connector.batches) == 1
+    assert connector.batches[0] == (("first", "second"), "memories")
+    assert results[0][0].payload["content"] == "result for first"
+    assert results[1][0].payload["content"] == "result for second"
+
+
+@pytest.mark.asyncio
+async def test_batches_are_grouped_by_collection():
+    connector = MockConnector()
+    batcher = FindBatcher(connector, limit=5)
+
+    await asyncio.gather(
+        batcher.search("first", "memories"),
+        batcher.search("second", "articles"),
+    )
+
+    assert sorted(connector.batches) == [
+        (("first",), "memories"),
+        (("second",), "articles"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_query_arriving_mid_dispatch_is_not_stranded():
+    class SlowConnector(MockConnector):
+        async def search_many(self, queries, *, collection_name, limit):
+            await asyncio.sleep(0.05)
+            return await super().search_many(
+                queries, collection_name=collection_name, limit=limit
+            )
+
+    connector = SlowConnector()
+    batcher = FindBatcher(connector, limit=5)
+
+    async def late_search():
+        # Arrives while the first batch's dispatch is still in flight
+        await asyncio.sleep(0.02)
+        return await batcher.search("late", "memories")
+
+    results = await asyncio.wait_for(
+        asyncio.gather(batcher.search("early", "memories"), late_search()),
+        timeout=2,
+    )
+
+    assert results[0][0].payload["content"] == "result for early"
+    assert results[1][0].payload["content"] == "result for late"
+
+
+@pytest.mark.asyncio
+async def test_search_errors_propagate_to_callers():
+    class FailingConnector:
+        async def search_many(self, queries, *, collection_name, limit):
+            raise RuntimeError("qdrant unavailable")
+
+    batcher = FindBatcher(FailingConnector(), limit=5)
+
+    with pytest.raises(RuntimeError, match="qdrant unavailable"):
+        await batcher.search("query", "memories")
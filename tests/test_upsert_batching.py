@@ -0,0 +1,64 @@
+# tests/test_upsert_batching.py
+
+import asyncio
+
+import pytest
+
+from mcp_server_qdrant.qdrant import Entry, QdrantConnector
+
+
+class MockEmbeddingProvider:
+    def get_vector_name(self):
+        return "default"
+
+    def get_vector_size(self):
+        return 8
+
+    async def embed_documents(self, texts):
+        return [[0.1] * self.get_vector_size() for _ in texts]
+
+    async def embed_query(self, query):
+        return [0.1] * self.get_vector_size()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_stores_share_one_upsert():
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name="test-batching",
+        embedding_provider=MockEmbeddingProvider(),
+    )
+
+    upsert_calls = []
+    original_upsert = connector._client.upsert
+
+    async def counting_upsert(*args, **kwargs):
+        upsert_calls.append(kwargs["points"])
+        return await original_upsert(*args, **kwargs)
+
+    connector._client.upsert = counting_upsert
+
+    await asyncio.gather(
+        connector.store(Entry(payload={"content": "first memory"})),
+        connector.store(Entry(payload={"content": "second memory"})),
+    )
+
+    assert len(upsert_calls) == 1
+    assert len(upsert_calls[0]) == 2
+
+
+@pytest.mark.asyncio
+async def test_store_still_persists_points():
+    connector = QdrantConnector(
+        qdrant_url=":memory:",
+        qdrant_api_key=None,
+        collection_name="test-batching",
+        embedding_provider=MockEmbeddingProvider(),
+    )
+
+    await connector.store(Entry(payload={"content": "a single memory"}))
+
+    results = await connector.search("a single memory")
+    assert len(results) == 1
+    assert results[0].payload["content"] == "a single memory"